@@ -69,14 +69,53 @@ NOTE: The snippet-destination-folder should point to the Hugo project root's
 """
 
 import argparse
+import json
 import os
+import posixpath
 import re
 import sys
 import shutil
 from pathlib import Path
 from collections import defaultdict
-from urllib.parse import unquote
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import quote, unquote
 
+import yaml
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+class MkDocsLoader(SafeLoader):
+    """Safe YAML loader tolerating the custom tags used in mkdocs.yml.
+
+    Tags such as !!python/name:material.extensions.emoji.twemoji or !ENV are
+    irrelevant to the nav structure and are loaded as None.
+    """
+
+
+MkDocsLoader.add_multi_constructor('tag:yaml.org,2002:python/', lambda loader, suffix, node: None)
+MkDocsLoader.add_multi_constructor('!', lambda loader, suffix, node: None)
+
+# Keep plain scalars as written: YAML 1.1 implicit typing would turn nav titles such as
+# "On", "No" or "1.10" into True, False or 1.1. An empty value still loads as None,
+# which is how a "- Section:" header without entries is recognized.
+_TYPED_SCALAR_TAGS = {'tag:yaml.org,2002:' + name for name in ('bool', 'int', 'float', 'null', 'timestamp')}
+MkDocsLoader.yaml_implicit_resolvers = {
+    first_char: [
+        (tag, regexp) for tag, regexp in resolvers
+        if tag not in _TYPED_SCALAR_TAGS or (first_char == '' and tag == 'tag:yaml.org,2002:null')
+    ]
+    for first_char, resolvers in SafeLoader.yaml_implicit_resolvers.items()
+}
+
+
+# Asset filenames repeat heavily across markdown files, so memoize their URL decoding
+_unquote_cached = lru_cache(maxsize=4096)(unquote)
 
 # Type mapping for MkDocs admonitions to Hugo/Docsy GFM alerts
 ADMONITION_TYPE_MAPPING = {
@@ -99,292 +138,410 @@ ADMONITION_PATTERN = re.compile(
     re.MULTILINE
 )
 
+# Compiled regex pattern for asset references (markdown images and HTML img tags),
+# with one named path group per syntax so a single pass can tell them apart
+ASSET_PATTERN = re.compile(
+    r'!\[(?P<alt>[^\]]*)\]\((?P<mdpath>[^)]+)\)'   # ![alt](path)
+    r'|<img\s+src="(?P<htmldq>[^"]+)"'             # <img src="path">
+    r"|<img\s+src='(?P<htmlsq>[^']+)'"             # <img src='path'>
+)
+
+# TOML front matter written at the top of every converted page (title, linkTitle, weight)
+FRONT_MATTER_TEMPLATE = '+++\ntitle = "{title}"\nlinkTitle = "{title}"\nweight = {weight}\n+++\n\n'
+
+# Parsed nav cache written to the working directory (disable with --no-cache)
+NAV_CACHE_FILE = '.nav_cache.json'
+# Bump whenever parse_mkdocs_nav changes what it produces, so older caches are reparsed
+NAV_CACHE_VERSION = 2
+
+# Compiled regex pattern for existing YAML (--- ... ---) or TOML (+++ ... +++) front matter
+FRONT_MATTER_PATTERN = re.compile(r'^(---|\+\+\+)\s*\n.*?\n\1\s*\n', re.DOTALL)
+
+# Compiled regex pattern for everything clean_markdown_content removes, in a single pass
+CLEANUP_PATTERN = re.compile(
+    r'(?i:<br\s*/?>)'                 # <br> and <br /> tags (any case)
+    r'|\{:\s*style="[^"]*"\s*\}'      # Markdown style attributes like {: style="width:70%;"}
+    r'|\{%-?\s*(?:end)?raw\s*-?%\}'   # Jinja2 raw/endraw tags: {% raw %}, {%- endraw -%}, etc.
+)
+
+# Compiled regex pattern for snippet includes, one alternative (and capture group) per syntax
+INCLUDE_PATTERN = re.compile(
+    # {% include 'file' %} inside a ```yaml or ``` yaml block, with optional trailing chars like :
+    r'```\s*yaml\s*\n\s*{%\s*include\s+["\']([^"\']+)["\']\s*%}[^\n]*\n\s*```'
+    r'|{%\s*include\s+["\']([^"\']+)["\']\s*%}'   # {% include 'file' %} without yaml block
+    r'|--8<--\s+"([^"]+.yaml)"'                   # MkDocs snippets: --8<-- "path/to/file.yaml"
+)
+
+# Compiled regex pattern for markdown links: [text](path)
+MARKDOWN_LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
 
-def parse_mkdocs_nav(yaml_path, source_dir):
+
+def _split_path(path):
+    """Split a '/'-separated nav or markdown path into (directory, filename).
+
+    Cheaper than os.path.dirname/basename, which also handle OS-specific
+    separators these paths never use.
+    """
+    i = path.rfind('/')
+    if i < 0:
+        return '', path
+    return path[:i], path[i + 1:]
+
+
+def normalize_newlines(content: str) -> str:
+    """Convert CRLF and lone CR line endings to LF, as reading in text mode does."""
+    if '\r' not in content:
+        return content
+    return content.replace('\r\n', '\n').replace('\r', '\n')
+
+
+@lru_cache(maxsize=None)
+def _title_from_path(path):
+    """Derive a page title from a nav file path ("guides/getting-started.md" -> "Getting Started")."""
+    return os.path.splitext(_split_path(path)[1])[0].replace('-', ' ').title()
+
+
+def parse_mkdocs_nav(yaml_path, source_files, missing_files=None):
     """Parse nav section from mkdocs.yml, building output hierarchy from nav structure.
 
-    The nav indentation determines the output folder hierarchy, NOT the source file paths.
+    The nav nesting determines the output folder hierarchy, NOT the source file paths.
+
+    Args:
+        yaml_path: Path to mkdocs.yml
+        source_files: Set of markdown file paths (relative to the source directory)
+            that exist; nav entries pointing elsewhere are skipped
+        missing_files: Optional list that nav entries missing from source_files are appended to
 
     Returns:
         tuple: (file_metadata dict, section_metadata dict)
             file_metadata: {source_filepath: {title, output_path, weight, ...}}
             section_metadata: {output_dir_path: {title, weight}}
     """
-    with open(yaml_path, 'r') as f:
-        content = f.read()
+    with open(yaml_path, 'r', encoding='utf-8') as f:
+        config = yaml.load(f, Loader=MkDocsLoader)
 
     # Extract nav section
-    nav_match = re.search(r'^nav:\s*$', content, re.MULTILINE)
-    if not nav_match:
+    nav = config.get('nav') if isinstance(config, dict) else None
+    if not nav:
         raise ValueError("No 'nav:' section found in mkdocs.yml")
 
-    nav_start = nav_match.end()
-    lines = content[nav_start:].split('\n')
-
     file_metadata = {}
     section_metadata = {}
 
-    # Track hierarchy path based on nav structure (not file paths)
-    # Example: ["community", "contributing"] means we're at Community > Contributing
-    hierarchy_path = []
-    hierarchy_titles = []  # Track the display titles at each level
-
-    # Weight tracking
-    weight_stack = [0]  # Stack of weights at each hierarchy level
+    # Weight tracking: every nav entry (section or file) takes the next slot
     global_weight = 0
 
-    for line in lines:
-        # Stop if we hit a new top-level key
-        if line and not line.startswith(' ') and not line.startswith('\t'):
-            break
-
-        # Skip empty lines
-        if not line.strip() or line.strip().startswith('#'):
-            continue
-
-        # Determine indentation level (2 spaces = level 1, 4 spaces = level 2, etc.)
-        indent = len(line) - len(line.lstrip())
-        stripped = line.strip()
-
-        if not stripped.startswith('- '):
-            continue
-
-        # Calculate hierarchy depth from indentation (2 spaces = depth 1, 4 = depth 2, 6 = depth 3, etc.)
-        hierarchy_depth = indent // 2
-
-        # Adjust hierarchy_path to current depth
-        # If we're at depth 2 but hierarchy_path has 3 items, we need to pop back
-        while len(hierarchy_path) >= hierarchy_depth:
-            hierarchy_path.pop()
-            hierarchy_titles.pop()
-            if len(weight_stack) > 1:
-                weight_stack.pop()
-
-        # Increment weight at current level
-        global_weight += 10
-
-        # Try to parse the line: could be a section header or a file reference
-        # Section header: "- SectionName:" (ends with colon, no file)
-        # File reference: "- Title: path/to/file.md" or "- path/to/file.md" or "path/to/file.md"
-
-        # First check if it's a section header (ends with : and nothing after)
-        section_match = re.match(r'-\s+(.+?):\s*$', stripped)
-        if section_match:
-            # This is a section/subsection header
-            section_title = section_match.group(1)
-            section_slug = section_title.lower().replace(' ', '-').replace(':', '').replace('_', '-')
-
-            # Add to hierarchy
-            hierarchy_path.append(section_slug)
-            hierarchy_titles.append(section_title)
-            weight_stack.append(global_weight)
-
-            # Create section_metadata entry for this directory
-            output_dir = '/'.join(hierarchy_path)
-            if output_dir not in section_metadata:
-                section_metadata[output_dir] = {
-                    'title': section_title,
-                    'weight': global_weight
-                }
-            continue
-
-        # It's a file reference - try different formats
-        file_title = None
-        source_filepath = None
-
-        # Try: "- Title: path/to/file.md" (double quotes)
-        file_match = re.match(r'-\s+"([^"]+)":\s+(.+\.md)', stripped)
-        if file_match:
-            file_title = file_match.group(1)
-            source_filepath = file_match.group(2)
-        else:
-            # Try: '- Title: path/to/file.md' (single quotes)
-            file_match = re.match(r"-\s+'([^']+)':\s+(.+\.md)", stripped)
-            if file_match:
-                file_title = file_match.group(1)
-                source_filepath = file_match.group(2)
+    def walk(items, hierarchy_path, hierarchy_titles):
+        """Walk a nav list, tracking the hierarchy path based on nav structure.
+
+        Example: ["community", "contributing"] means we're at Community > Contributing
+        """
+        nonlocal global_weight
+
+        for item in items:
+            # Increment weight at current level
+            global_weight += 10
+
+            # Entries are either "- Title: value" (one-key mapping) or "- path/to/file.md"
+            if isinstance(item, dict):
+                if not item:
+                    continue
+                title, value = next(iter(item.items()))
+                title = str(title)
             else:
-                # Try: "- Title: path/to/file.md" (no quotes)
-                file_match = re.match(r'-\s+(.+?):\s+(.+\.md)', stripped)
-                if file_match:
-                    file_title = file_match.group(1)
-                    source_filepath = file_match.group(2)
-                else:
-                    # Try: "- path/to/file.md" (quoted, no title)
-                    file_match = re.match(r'-\s+"(.+\.md)"', stripped)
-                    if file_match:
-                        source_filepath = file_match.group(1)
-                        # Derive title from filename
-                        file_title = os.path.splitext(os.path.basename(source_filepath))[0].replace('-', ' ').title()
-
-        if not source_filepath:
-            # Couldn't parse this line, skip it
-            continue
-
-        # Check if source file exists
-        full_source_path = os.path.join(source_dir, source_filepath)
-        if not os.path.exists(full_source_path):
-            print(f"Warning: Source file not found: {source_filepath}", file=sys.stderr)
-            continue
-
-        # Special case: api/generator/index.md should have title "Introduction"
-        if source_filepath == "api/generator/index.md":
-            file_title = "Introduction"
-            output_filename = "introduction.md"
-        else:
-            output_filename = os.path.basename(source_filepath)
+                title, value = None, item
+
+            # Section header: "- SectionName:" followed by a nested list
+            if title is not None and (value is None or isinstance(value, list)):
+                section_slug = title.lower().replace(' ', '-').replace(':', '').replace('_', '-')
+                section_path = hierarchy_path + [section_slug]
+
+                # Create section_metadata entry for this directory
+                output_dir = '/'.join(section_path)
+                if output_dir not in section_metadata:
+                    section_metadata[output_dir] = {
+                        'title': title,
+                        'weight': global_weight
+                    }
+
+                walk(value or [], section_path, hierarchy_titles + [title])
+                continue
+
+            # It's a file reference: skip anything that isn't a markdown file (e.g. external links)
+            if not isinstance(value, str) or not value.endswith('.md'):
+                continue
+
+            source_filepath = value
+            if title is not None:
+                file_title = title
+            else:
+                # Derive title from filename
+                file_title = _title_from_path(source_filepath)
+
+            # Check if source file exists
+            if source_filepath not in source_files:
+                print(f"Warning: Source file not found: {source_filepath}", file=sys.stderr)
+                if missing_files is not None:
+                    missing_files.append(source_filepath)
+                continue
+
+            # Special case: api/generator/index.md should have title "Introduction"
+            if source_filepath == "api/generator/index.md":
+                file_title = "Introduction"
+                output_filename = "introduction.md"
+            else:
+                _, output_filename = _split_path(source_filepath)
 
-        # Build output path from hierarchy
-        if hierarchy_path:
-            output_path = '/'.join(hierarchy_path) + '/' + output_filename
-        else:
-            output_path = output_filename
-
-        # Store file metadata
-        file_metadata[source_filepath] = {
-            'title': file_title,
-            'output_path': output_path,
-            'weight': global_weight,
-            'hierarchy': list(hierarchy_path),  # Copy for reference
-            'hierarchy_titles': list(hierarchy_titles)
-        }
+            # Build output path from hierarchy
+            if hierarchy_path:
+                output_path = '/'.join(hierarchy_path) + '/' + output_filename
+            else:
+                output_path = output_filename
+
+            # Store file metadata
+            file_metadata[source_filepath] = {
+                'title': file_title,
+                'output_path': output_path,
+                'weight': global_weight,
+                'hierarchy': list(hierarchy_path),  # Copy for reference
+                'hierarchy_titles': list(hierarchy_titles)
+            }
+
+    walk(nav, [], [])
 
     return file_metadata, section_metadata
 
 
 
+def load_nav_metadata(yaml_path, source_dir, source_files, cache_path=None):
+    """Parse the mkdocs.yml nav, reusing a JSON cache of the previous result when possible.
+
+    The cache is only used when it was written with the current NAV_CACHE_VERSION,
+    mkdocs.yml has not been modified and the source directory holds the same
+    markdown files as when it was written.
+
+    Args:
+        yaml_path: Path to mkdocs.yml
+        source_dir: Path to directory containing markdown files
+        source_files: Set of markdown file paths (relative to source_dir)
+        cache_path: Path to the JSON cache file, or None to always parse
+
+    Returns:
+        tuple: (file_metadata dict, section_metadata dict), as from parse_mkdocs_nav
+    """
+    cache_key = {
+        'version': NAV_CACHE_VERSION,
+        'config': os.path.abspath(yaml_path),
+        'mtime': os.path.getmtime(yaml_path),
+        'source': os.path.abspath(source_dir),
+        'files': sorted(source_files),
+    }
+
+    if cache_path:
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached['key'] == cache_key:
+                # Repeat the warnings the original parse printed
+                for source_filepath in cached['missing_files']:
+                    print(f"Warning: Source file not found: {source_filepath}", file=sys.stderr)
+                return cached['file_metadata'], cached['section_metadata']
+        except (OSError, ValueError, KeyError, TypeError):
+            # No usable cache: fall through to a full parse
+            pass
+
+    missing_files = []
+    file_metadata, section_metadata = parse_mkdocs_nav(yaml_path, source_files, missing_files)
+
+    if cache_path:
+        try:
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'key': cache_key,
+                    'missing_files': missing_files,
+                    'file_metadata': file_metadata,
+                    'section_metadata': section_metadata,
+                }, f)
+        except OSError as e:
+            print(f"Warning: Could not write nav cache {cache_path}: {e}", file=sys.stderr)
+
+    return file_metadata, section_metadata
+
+
 def generate_front_matter(metadata):
     """Generate TOML front matter string."""
-    title = metadata['title']
-    weight = metadata['weight']
+    return FRONT_MATTER_TEMPLATE.format_map(metadata)
 
-    front_matter = f"""+++
-title = "{title}"
-linkTitle = "{title}"
-weight = {weight}
-+++
 
-"""
+def iter_files(root):
+    """Yield every file below root, depth first, without following directory symlinks.
 
-    return front_matter
+    Uses os.scandir so file types come from the cached directory entries
+    instead of one stat() per path, and walks with an explicit stack of open
+    directory iterators rather than recursing (one generator frame in total).
 
+    Yields:
+        tuple: (path relative to root, '/'-separated like nav and URL paths, os.DirEntry)
+    """
+    prefix_len = len(os.path.join(root, ''))
+    native_sep = os.sep if os.sep != '/' else None
+    stack = [os.scandir(root)]
+    try:
+        while stack:
+            for entry in stack[-1]:
+                if entry.is_dir(follow_symlinks=False):
+                    # Descend now, resuming this directory once the subtree is done
+                    stack.append(os.scandir(entry.path))
+                    break
+                if entry.is_file():
+                    relative_path = entry.path[prefix_len:]
+                    if native_sep:
+                        relative_path = relative_path.replace(native_sep, '/')
+                    yield relative_path, entry
+            else:
+                stack.pop().close()
+    finally:
+        for entries in stack:
+            entries.close()
 
-def find_asset_in_folder(asset_filename, assets_folder):
-    """Search for an asset file recursively in the assets folder.
+
+def build_asset_index(assets_folder):
+    """Scan the assets folder once and index every file by its filename.
 
     Returns:
-        str: Relative path from assets folder root (URL-encoded), or None if not found
+        dict: {filename, percent-encoded filename or lowercased filename:
+            relative path from assets folder root (URL-encoded)}
     """
-    assets_path = Path(assets_folder)
+    asset_index = {}
 
-    # URL-decode the filename (handles %20 and other encoded chars)
-    decoded_filename = unquote(asset_filename)
+    for relative_path, asset_file in iter_files(assets_folder):
+        # Store the final URL path relative to assets folder root, percent-encoded
+        # once here (spaces become %20) so lookups return it as-is
+        # First file found wins when several share the same name
+        asset_index.setdefault(asset_file.name, '/' + quote(relative_path, safe='/'))
 
-    # Search recursively for the file (try both encoded and decoded versions)
-    for asset_file in assets_path.rglob('*'):
-        if asset_file.is_file():
-            # Check both the original and decoded filename
-            if asset_file.name == asset_filename or asset_file.name == decoded_filename:
-                # Return path relative to assets folder root
-                # Keep spaces as %20 in the URL
-                relative_path = str(asset_file.relative_to(assets_path))
-                # URL encode spaces and other special characters
-                encoded_path = relative_path.replace(' ', '%20')
-                return '/' + encoded_path
+    # Percent-encoded aliases ('test%20image.png'), which is how markdown usually
+    # references names with spaces, so those resolve without unquoting
+    for filename, url_path in list(asset_index.items()):
+        asset_index.setdefault(quote(filename), url_path)
 
-    return None
+    # Lowercased names as a case-insensitive fallback, added after the exact
+    # names so they never shadow a file whose name matches exactly
+    for filename, url_path in list(asset_index.items()):
+        asset_index.setdefault(filename.lower(), url_path)
 
+    return asset_index
 
-def rewrite_asset_paths(content, assets_folder, assets_tracking, md_filename):
-    """Rewrite asset paths in markdown content.
 
-    Args:
-        content: Markdown content
-        assets_folder: Path to assets folder
-        assets_tracking: Dict to track asset->md file mappings
-        md_filename: Name of the markdown file being processed
+def find_asset_in_index(asset_filename: str, asset_index: dict):
+    """Look up an asset file in an index built by build_asset_index.
 
     Returns:
-        str: Content with rewritten asset paths
+        str: Relative path from assets folder root (URL-encoded), or None if not found
     """
-    # Pattern to match markdown images and HTML img tags
-    patterns = [
-        r'!\[([^\]]*)\]\(([^)]+)\)',  # ![alt](path)
-        r'<img\s+src="([^"]+)"',       # <img src="path">
-        r'<img\s+src=\'([^\']+)\'',    # <img src='path'>
-    ]
-
-    modified_content = content
+    # The index also holds percent-encoded names, so '%20' references usually hit
+    # directly; decode only on a miss (other encodings, lowercase hex, case fallback)
+    new_path = asset_index.get(asset_filename)
+    if new_path is None:
+        decoded_filename = _unquote_cached(asset_filename)
+        new_path = asset_index.get(decoded_filename) or asset_index.get(decoded_filename.lower())
+    return new_path
 
-    for pattern in patterns:
-        def replace_asset(match):
-            try:
-                if pattern.startswith('!'):
-                    # Markdown image format
-                    alt_text = match.group(1)
-                    asset_path = match.group(2)
 
-                    # Extract filename from path and decode URL encoding
-                    asset_filename = os.path.basename(asset_path)
+@lru_cache(maxsize=None)
+def cached_asset_index(assets_folder):
+    """Build the asset index for a folder once and reuse it for later lookups."""
+    return build_asset_index(assets_folder)
 
-                    # Skip external URLs
-                    if asset_path.startswith('http://') or asset_path.startswith('https://'):
-                        return match.group(0)
 
-                    # Skip if asset_path is empty or just whitespace
-                    if not asset_filename or not asset_filename.strip():
-                        return match.group(0)
+def find_asset_in_folder(asset_filename, assets_folder):
+    """Search for an asset file recursively in the assets folder.
 
-                    # Find asset in assets folder
-                    new_path = find_asset_in_folder(asset_filename, assets_folder)
+    Returns:
+        str: Relative path from assets folder root (URL-encoded), or None if not found
+    """
+    return find_asset_in_index(asset_filename, cached_asset_index(assets_folder))
 
-                    if new_path:
-                        # Track this asset (using decoded name for readability)
-                        decoded_filename = unquote(asset_filename)
-                        assets_tracking[decoded_filename].add(md_filename)
-                        return f'![{alt_text}]({new_path})'
-                    else:
-                        # Keep original path but warn
-                        decoded_filename = unquote(asset_filename)
-                        print(f"Warning: Asset '{decoded_filename}' referenced in '{md_filename}' not found in assets folder", file=sys.stderr)
-                        return match.group(0)
-                else:
-                    # HTML img tag format
-                    asset_path = match.group(1)
-                    asset_filename = os.path.basename(asset_path)
 
-                    # Skip external URLs
-                    if asset_path.startswith('http://') or asset_path.startswith('https://'):
-                        return match.group(0)
+def rewrite_asset_paths(content: str, asset_index: dict, assets_tracking, md_filename: str, warning_messages: list) -> str:
+    """Rewrite asset paths in markdown content.
 
-                    # Skip if asset_path is empty or just whitespace
-                    if not asset_filename or not asset_filename.strip():
-                        return match.group(0)
+    Args:
+        content: Markdown content
+        asset_index: Asset filename index from build_asset_index
+        assets_tracking: Dict of lists to track asset->md file mappings (may repeat)
+        md_filename: Name of the markdown file being processed
+        warning_messages: List collecting warnings, printed by the caller
 
-                    # Find asset in assets folder
-                    new_path = find_asset_in_folder(asset_filename, assets_folder)
+    Returns:
+        str: Content with rewritten asset paths
+    """
+    # Most pages have no images: a substring check is much cheaper than the regex scan
+    if '![' not in content and '<img' not in content:
+        return content
+
+    def resolve_asset(asset_path):
+        """Find the new path for an asset reference, tracking or warning about it.
+
+        Returns:
+            str: New asset path, or None if the reference should be kept as-is
+        """
+        # Skip external URLs (including protocol-relative ones) and inline data URIs
+        if asset_path.startswith(('http://', 'https://', '//', 'data:')):
+            return None
+
+        # Extract filename from path; skip if it is empty or just whitespace
+        _, asset_filename = _split_path(asset_path)
+        if not asset_filename.strip():
+            return None
+
+        # Find asset in assets folder
+        new_path = find_asset_in_index(asset_filename, asset_index)
+
+        # Track or report using the decoded name for readability
+        decoded_filename = _unquote_cached(asset_filename)
+        if new_path:
+            assets_tracking[decoded_filename].append(md_filename)
+        else:
+            # Keep original path but warn
+            warning_messages.append(f"Warning: Asset '{decoded_filename}' referenced in '{md_filename}' not found in assets folder")
+        return new_path
+
+    # Rebuild the content from the unchanged stretches and the rewritten references,
+    # only touching the output where a path actually changes
+    parts = []
+    pos = 0
+    try:
+        for match in ASSET_PATTERN.finditer(content):
+            try:
+                path_group = match.lastgroup
+                asset_path = match.group(path_group)
+                new_path = resolve_asset(asset_path)
+                if not new_path:
+                    continue
 
-                    if new_path:
-                        # Track this asset (using decoded name for readability)
-                        decoded_filename = unquote(asset_filename)
-                        assets_tracking[decoded_filename].add(md_filename)
-                        return match.group(0).replace(asset_path, new_path)
-                    else:
-                        # Keep original path but warn
-                        decoded_filename = unquote(asset_filename)
-                        print(f"Warning: Asset '{decoded_filename}' referenced in '{md_filename}' not found in assets folder", file=sys.stderr)
-                        return match.group(0)
+                if path_group == 'mdpath':
+                    # Markdown image format
+                    replacement = f'![{match.group("alt")}]({new_path})'
+                else:
+                    # HTML img tag format
+                    replacement = match.group(0).replace(asset_path, new_path)
             except Exception as e:
-                # Guard against any regex or processing errors
-                print(f"Error processing asset in '{md_filename}': {e}", file=sys.stderr)
-                return match.group(0)
-
-        try:
-            modified_content = re.sub(pattern, replace_asset, modified_content)
-        except Exception as e:
-            print(f"Error rewriting assets in '{md_filename}': {e}", file=sys.stderr)
-
-    return modified_content
+                # Guard against any processing errors, keeping the reference as-is
+                warning_messages.append(f"Error processing asset in '{md_filename}': {e}")
+                continue
+
+            parts.append(content[pos:match.start()])
+            parts.append(replacement)
+            pos = match.end()
+    except Exception as e:
+        warning_messages.append(f"Error rewriting assets in '{md_filename}': {e}")
+        return content
+
+    if not parts:
+        return content
+    parts.append(content[pos:])
+    return ''.join(parts)
 
 def create_root_folder_index_file(path, restored_content=""):
     """ Create _index.md file for root directory """
@@ -422,13 +579,16 @@ weight = {weight}
 {restored_content}
 """
 
-    with open(index_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    Path(index_path).write_text(content, encoding='utf-8')
 
 def write_bundle_files(section_metadata, dest):
     # Replace index.md with _index.md files for directories
     print("Now creating leaf bundles files instead of branch bundle files...")
-    for dir_path, metadata in sorted(section_metadata.items()):
+
+    def write_section_bundle(section):
+        """Write the _index.md of one section, returning the messages to print."""
+        dir_path, metadata = section
+        messages = []
         full_dir_path = os.path.join(dest, dir_path)
         leaf_bundle_file = os.path.join(full_dir_path,"index.md")
         file_to_delete = os.path.exists(leaf_bundle_file)
@@ -441,14 +601,21 @@ def write_bundle_files(section_metadata, dest):
         # else:
         #     optional_content = ""
 
-        branch_bundle_file = os.path.join(full_dir_path,"_index.md")
         create_index_file(full_dir_path, metadata)
 
-        print(f"Created or updated {dir_path}/_index.md (title=\"{metadata['title']}\", weight={metadata['weight']})")
+        messages.append(f"Created or updated {dir_path}/_index.md (title=\"{metadata['title']}\", weight={metadata['weight']})\n")
 
         if file_to_delete:
             Path.unlink(leaf_bundle_file)
-            print(f"Deleted {leaf_bundle_file}")
+            messages.append(f"Deleted {leaf_bundle_file}\n")
+
+        return messages
+
+    # Each section is independent blocking file I/O, so overlap them in threads.
+    # map() keeps the sorted order for the messages, printed once all are written.
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        section_messages = list(executor.map(write_section_bundle, sorted(section_metadata.items())))
+    sys.stdout.write(''.join(message for messages in section_messages for message in messages))
 
     base_folder_leaf_bundle = os.path.join(dest, "index.md")
     base_folder_branch_bundle = os.path.join(dest, "_index.md")
@@ -462,39 +629,27 @@ def write_bundle_files(section_metadata, dest):
         Path.unlink(base_folder_leaf_bundle)
         print(f"Deleted {base_folder_leaf_bundle}")
 
-def strip_existing_front_matter(content):
+def strip_existing_front_matter(content: str) -> str:
     """Remove existing YAML or TOML front matter from content."""
-    # Strip YAML front matter (--- ... ---)
-    yaml_pattern = r'^---\s*\n.*?\n---\s*\n'
-    content = re.sub(yaml_pattern, '', content, flags=re.DOTALL)
-
-    # Strip TOML front matter (+++ ... +++)
-    toml_pattern = r'^\+\+\+\s*\n.*?\n\+\+\+\s*\n'
-    content = re.sub(toml_pattern, '', content, flags=re.DOTALL)
+    # Front matter can only sit at the very start: skip the regex for everything else
+    if not content.startswith(('---', '+++')):
+        return content
+    return FRONT_MATTER_PATTERN.sub('', content, count=1)
 
-    return content
 
+def clean_markdown_content(content: str) -> str:
+    """Remove unwanted HTML and markdown attributes.
 
-def clean_markdown_content(content):
-    """Remove unwanted HTML and markdown attributes."""
-    # Remove <br> and <br /> tags
-    content = re.sub(r'<br\s*/?>', '', content, flags=re.IGNORECASE)
-
-    # Remove markdown style attributes like {: style="width:70%;"}
-    content = re.sub(r'\{:\s*style="[^"]*"\s*\}', '', content)
-
-    # Remove Jinja2 raw tags (all variations)
-    # Matches: {% raw %}, {%- raw %}, {% raw -%}, {%- raw -%}
-    content = re.sub(r'\{%-?\s*raw\s*-?%\}', '', content)
-
-    # Remove Jinja2 endraw tags (all variations)
-    # Matches: {% endraw %}, {%- endraw %}, {% endraw -%}, {%- endraw -%}
-    content = re.sub(r'\{%-?\s*endraw\s*-?%\}', '', content)
-
-    return content
+    Removes <br> tags, style attributes and Jinja2 raw/endraw tags in one pass.
+    """
+    # Every removable token starts with '<' or '{': substring checks are much
+    # cheaper than the regex scan for content that has neither
+    if '<' not in content and '{' not in content:
+        return content
+    return CLEANUP_PATTERN.sub('', content)
 
 
-def convert_admonitions(content):
+def convert_admonitions(content: str) -> str:
     """Convert MkDocs admonitions to Hugo/Docsy GFM alerts.
 
     Transforms MkDocs admonition syntax like:
@@ -570,7 +725,9 @@ def convert_admonitions(content):
 def copy_snippets_folder(source_dir, snippet_dest_folder):
     """Copy snippets folder from source to destination.
 
-    Cleans Jinja2 raw/endraw tags from snippet files during copy.
+    Cleans Jinja2 raw/endraw tags from snippet files during copy. Copies keep
+    their source's modification time, and files whose destination copy still
+    has exactly that time are left untouched.
 
     Args:
         source_dir: Path to source directory (where mkdocs files are)
@@ -587,7 +744,8 @@ def copy_snippets_folder(source_dir, snippet_dest_folder):
     # Create destination directory if it doesn't exist
     os.makedirs(snippet_dest_folder, exist_ok=True)
 
-    # Copy all files from snippets folder to destination
+    # Mirror the directory structure first and collect the files to copy
+    copies = []
     for root, dirs, files in os.walk(snippets_path):
         # Calculate relative path from snippets root
         rel_path = os.path.relpath(root, snippets_path)
@@ -599,33 +757,67 @@ def copy_snippets_folder(source_dir, snippet_dest_folder):
             dest_dir = snippet_dest_folder
         os.makedirs(dest_dir, exist_ok=True)
 
-        # Process files
         for filename in files:
-            src_file = os.path.join(root, filename)
-            if rel_path != '.':
-                dst_file = os.path.join(snippet_dest_folder, rel_path, filename)
-            else:
-                dst_file = os.path.join(snippet_dest_folder, filename)
+            copies.append((os.path.join(root, filename), os.path.join(dest_dir, filename)))
 
-            # Read file content
-            try:
-                with open(src_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
+    def copy_snippet(paths):
+        src_file, dst_file = paths
 
-                # Clean raw/endraw tags from snippet files
-                content = clean_markdown_content(content)
+        # Skip files already mirrored by a previous run. Sizes can't be compared since
+        # cleaning changes them, but every copy carries its source's exact mtime, so
+        # any other mtime (older or newer, e.g. from an extracted archive) means recopy.
+        try:
+            if os.stat(dst_file).st_mtime_ns == os.stat(src_file).st_mtime_ns:
+                return
+        except FileNotFoundError:
+            pass
+
+        try:
+            # Read each file once; the same bytes serve the text and binary cases
+            with open(src_file, 'rb') as f:
+                data = f.read()
 
-                # Write cleaned content
-                with open(dst_file, 'w', encoding='utf-8') as f:
-                    f.write(content)
-            except (UnicodeDecodeError, IOError):
-                # If file is binary or can't be read as text, just copy it
-                shutil.copy2(src_file, dst_file)
+            try:
+                content = data.decode('utf-8')
+            except UnicodeDecodeError:
+                # Binary file: write the bytes already read, keeping the source metadata like copy2
+                with open(dst_file, 'wb') as f:
+                    f.write(data)
+                shutil.copystat(src_file, dst_file)
+                return
+
+            # Match the newline handling of reading in text mode
+            content = normalize_newlines(content)
+
+            # Clean raw/endraw tags from snippet files
+            content = clean_markdown_content(content)
+
+            # Write cleaned content, stamped with the source's mtime for the skip check above
+            with open(dst_file, 'wb') as f:
+                f.write(content.encode('utf-8'))
+            shutil.copystat(src_file, dst_file)
+        except IOError:
+            # If the file can't be read or written directly, fall back to a plain copy
+            shutil.copy2(src_file, dst_file)
+
+    # Copies are independent and I/O bound, so overlap them on a few threads
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        for _ in executor.map(copy_snippet, copies):
+            pass
 
     return True
 
 
-def replace_yaml_includes(content, snippet_dest_folder, missing_snippets, md_filename, depth=1):
+def build_snippet_index(snippet_dest_folder):
+    """Scan the snippet destination folder once and collect available snippets.
+
+    Returns:
+        set: '/'-separated snippet paths relative to the snippet destination folder
+    """
+    return {relative_path for relative_path, _ in iter_files(snippet_dest_folder)}
+
+
+def replace_yaml_includes(content: str, snippet_dest_folder: str, missing_snippets: list, md_filename: str, depth: int = 1, existing_snippets=None) -> str:
     """Replace include blocks with Hugo readfile shortcodes.
 
     Handles both:
@@ -639,23 +831,27 @@ def replace_yaml_includes(content, snippet_dest_folder, missing_snippets, md_fil
         snippet_dest_folder: Path to snippet destination folder
         missing_snippets: List to track missing snippet references
         md_filename: Name of the markdown file being processed
+        depth: Depth of the markdown file below the destination root
+        existing_snippets: Snippet index from build_snippet_index (scanned from
+            snippet_dest_folder when not given)
 
     Returns:
         str: Content with replaced include blocks
     """
+    if existing_snippets is None:
+        existing_snippets = build_snippet_index(snippet_dest_folder)
 
     def replace_include(match):
-        snippet_path = match.group(1)
+        snippet_path = match.group(1) or match.group(2) or match.group(3)
         # Preserve the full relative path (including subdirectories)
         # e.g., 'gitops/kustomization.yaml' stays as 'gitops/kustomization.yaml'
 
         # Except when mistakes happen on double /snippets/snippet...
         snippet_path.replace('/snippets/', '/')
 
-        # Check if snippet exists in destination folder (using full path)
-        full_snippet_path = os.path.join(snippet_dest_folder, snippet_path)
-
-        if not os.path.exists(full_snippet_path):
+        # Check if snippet exists in destination folder (using full path); only
+        # normalize references like './file.yaml' when the plain lookup misses
+        if snippet_path not in existing_snippets and posixpath.normpath(snippet_path) not in existing_snippets:
             missing_snippets.append({
                 'snippet': snippet_path,
                 'referenced_in': md_filename
@@ -669,26 +865,12 @@ def replace_yaml_includes(content, snippet_dest_folder, missing_snippets, md_fil
         # General case: Only one level down. If problem, let's fix it manually.
         return f'{{{{< readfile file={path_prefix}snippets/{snippet_path} code="true" lang="yaml" >}}}}'
 
-    modified_content = content
-
-    # Pattern 1: {% include with surrounding ```yaml ``` or ``` yaml ``` block (single or double quotes)
-    # Matches: ```yaml\n{% include 'file' %}\n``` or ``` yaml\n{% include 'file' %}\n```
-    # Also handles trailing chars like : after the %}
-    pattern_yaml_block = r'```\s*yaml\s*\n\s*{%\s*include\s+["\']([^"\']+)["\']\s*%}[^\n]*\n\s*```'
-    modified_content = re.sub(pattern_yaml_block, replace_include, modified_content)
-
-    # Pattern 2: {% include without yaml block (single or double quotes)
-    pattern_include = r'{%\s*include\s+["\']([^"\']+)["\']\s*%}'
-    modified_content = re.sub(pattern_include, replace_include, modified_content)
-
-    # Pattern 3: MkDocs snippets syntax: --8<-- "path/to/file.yaml"
-    pattern_mkdocs_yaml = r'--8<--\s+"([^"]+.yaml)"'
-    modified_content = re.sub(pattern_mkdocs_yaml, replace_include, modified_content)
-
-    return modified_content
+    # Single pass over the content for all three include syntaxes:
+    # ```yaml\n{% include 'file' %}\n``` (or ``` yaml), bare {% include 'file' %}, and --8<-- "file"
+    return INCLUDE_PATTERN.sub(replace_include, content)
 
 
-def rewrite_internal_links(content, current_file_output_path, file_metadata):
+def rewrite_internal_links(content: str, current_file_output_path: str, file_metadata: dict) -> str:
     """Rewrite internal markdown links since files have moved in hierarchy.
 
     Args:
@@ -739,7 +921,7 @@ def rewrite_internal_links(content, current_file_output_path, file_metadata):
             target_output_path = source_to_output[link_target]
         else:
             # Try filename match
-            target_filename = os.path.basename(link_target)
+            _, target_filename = _split_path(link_target)
             if target_filename in filename_to_outputs:
                 possible_outputs = filename_to_outputs[target_filename]
                 if len(possible_outputs) == 1:
@@ -757,16 +939,54 @@ def rewrite_internal_links(content, current_file_output_path, file_metadata):
         # Construct new link
         return f'[{link_text}]({rel_path}{anchor})'
 
-    # Pattern to match markdown links: [text](path)
-    link_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
-    return re.sub(link_pattern, replace_link, content)
+    return MARKDOWN_LINK_PATTERN.sub(replace_link, content)
 
 
-def convert_file(src_path, dst_path, metadata, assets_folder, assets_tracking, snippet_dest_folder, missing_snippets, rootDir, file_metadata):
-    """Read source, prepend front matter, rewrite assets, write to destination."""
+def write_file_if_changed(path, parts):
+    """Write a sequence of byte chunks to path unless the file already holds exactly that content.
+
+    The chunks are written back to back, so callers never need to join them into one buffer.
+
+    Returns:
+        bool: True if the file was written, False if it was already up to date
+    """
+    try:
+        if os.path.getsize(path) == sum(len(part) for part in parts):
+            existing = memoryview(Path(path).read_bytes())
+            offset = 0
+            for part in parts:
+                if existing[offset:offset + len(part)] != part:
+                    break
+                offset += len(part)
+            else:
+                return False
+    except OSError:
+        # Destination doesn't exist yet (or can't be read): just write it
+        pass
+
+    with open(path, 'wb') as f:
+        f.writelines(parts)
+    return True
+
+
+def convert_file(src_path, dst_path, metadata, asset_index, snippet_dest_folder, existing_snippets, rootDir, file_metadata):
+    """Read source, prepend front matter, rewrite assets, write to destination.
+
+    Returns:
+        tuple: (assets_tracking, missing_snippets, warning_messages) collected for this file
+            assets_tracking: {asset_filename: [md_filename]}
+            missing_snippets: [{snippet, referenced_in}]
+            warning_messages: [str]
+    """
+    assets_tracking = defaultdict(list)
+    missing_snippets = []
+    warning_messages = []
+
     # Read source file
-    with open(src_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    content = Path(src_path).read_bytes().decode('utf-8')
+
+    # Match the newline handling of reading in text mode, so CRLF sources come out as LF
+    content = normalize_newlines(content)
 
     # Strip any existing front matter (including hide_toc metadata)
     content = strip_existing_front_matter(content)
@@ -790,16 +1010,29 @@ def convert_file(src_path, dst_path, metadata, assets_folder, assets_tracking, s
 
     # Rewrite asset paths
     md_filename = os.path.basename(dst_path)
-    content = rewrite_asset_paths(content, assets_folder, assets_tracking, md_filename)
+    content = rewrite_asset_paths(content, asset_index, assets_tracking, md_filename, warning_messages)
 
     # Replace YAML include blocks with readfile shortcode
-    content = replace_yaml_includes(content, snippet_dest_folder, missing_snippets, md_filename, depth)
+    content = replace_yaml_includes(content, snippet_dest_folder, missing_snippets, md_filename, depth, existing_snippets)
 
-    # Combine and write
-    output = front_matter + content
+    # Write front matter and body back to back instead of building one combined copy
+    write_file_if_changed(dst_path, (front_matter.encode('utf-8'), content.encode('utf-8')))
 
-    with open(dst_path, 'w', encoding='utf-8') as f:
-        f.write(output)
+    return assets_tracking, missing_snippets, warning_messages
+
+
+# Conversion inputs shared by every file, set once per worker process by init_convert_worker
+_worker_context = {}
+
+
+def init_convert_worker(context):
+    """Store the shared conversion inputs in a worker process."""
+    _worker_context.update(context)
+
+
+def convert_file_in_worker(src_path, dst_path, metadata):
+    """Run convert_file in a worker process using the shared conversion inputs."""
+    return convert_file(src_path, dst_path, metadata, **_worker_context)
 
 
 def main():
@@ -808,6 +1041,7 @@ def main():
     parser.add_argument('--source', required=True, help='Path to directory containing markdown files')
     parser.add_argument('--dest', required=True, help='Destination directory for converted files')
     parser.add_argument('--assets-folder', required=True, help='Path to assets folder (e.g., ./static/)')
+    parser.add_argument('--no-cache', action='store_true', help=f'Always parse the config instead of reusing {NAV_CACHE_FILE}')
 
     args = parser.parse_args()
 
@@ -838,19 +1072,20 @@ def main():
     else:
         print("  No snippets folder found in source directory")
 
+    # Index copied snippets once so includes don't stat the filesystem per reference
+    existing_snippets = build_snippet_index(snippet_destination_folder)
+
+    # Scan source directory once for all markdown files (also used to validate nav entries).
+    # Paths use '/' like the nav entries in mkdocs.yml, whatever the platform.
+    all_md_files = {rel_path for rel_path, entry in iter_files(args.source) if entry.name.endswith('.md')}
+
     print(f"\nParsing {args.config}...")
-    file_metadata, section_metadata = parse_mkdocs_nav(args.config, args.source)
+    file_metadata, section_metadata = load_nav_metadata(
+        args.config, args.source, all_md_files, None if args.no_cache else NAV_CACHE_FILE)
 
     print(f"Found {len(file_metadata)} files in navigation")
     print(f"Found {len(section_metadata)} directories to create")
 
-    # Scan source directory for all markdown files
-    source_path = Path(args.source)
-    all_md_files = set()
-    for md_file in source_path.rglob('*.md'):
-        rel_path = md_file.relative_to(source_path)
-        all_md_files.add(str(rel_path))
-
     # Find unmatched files
     matched_files = set(file_metadata.keys())
     unmatched_files = all_md_files - matched_files
@@ -875,17 +1110,25 @@ def main():
         }
 
     print("Creating directory index files...")
+    created = []
     for dir_path, metadata in sorted(section_metadata.items()):
         full_dir_path = os.path.join(args.dest, dir_path)
         os.makedirs(full_dir_path, exist_ok=True)
-        print(f"  Created {full_dir_path}")
+        created.append(f"  Created {full_dir_path}\n")
+    sys.stdout.write(''.join(created))
+
+    # Index assets once so lookups don't rescan the assets folder per reference
+    asset_index = build_asset_index(args.assets_folder)
 
     # Asset tracking
-    assets_tracking = defaultdict(set)
+    assets_tracking = defaultdict(list)
 
     # Missing snippets tracking
     missing_snippets = []
 
+    # Warnings from the conversion, written out in one go once all files are done
+    warning_messages = []
+
     # Convert files
     print("\nConverting markdown files...")
     converted_count = 0
@@ -893,30 +1136,54 @@ def main():
     converted_unmatched = 0
     error_count = 0
 
-    for filepath, metadata in file_metadata.items():
-        src_path = os.path.join(args.source, filepath)
-
-        # Use output_path if available (for renamed files like index.md -> introduction.md)
-        output_filepath = metadata.get('output_path', filepath)
-        dst_path = os.path.join(args.dest, output_filepath)
-
-        # Create parent directory if it doesn't exist
-        dst_dir = os.path.dirname(dst_path)
+    # Files are independent, so convert them in parallel. Inputs shared by all files
+    # are sent once per worker rather than once per file.
+    worker_context = {
+        'asset_index': asset_index,
+        'snippet_dest_folder': snippet_destination_folder,
+        'existing_snippets': existing_snippets,
+        'rootDir': args.dest,
+        'file_metadata': file_metadata,
+    }
+    # Use output_path if available (for renamed files like index.md -> introduction.md)
+    dst_paths = {
+        filepath: os.path.join(args.dest, metadata.get('output_path', filepath))
+        for filepath, metadata in file_metadata.items()
+    }
+
+    # Create each parent directory once, up front, so workers never race on it
+    for dst_dir in sorted({os.path.dirname(dst_path) for dst_path in dst_paths.values()}):
         if dst_dir:
             os.makedirs(dst_dir, exist_ok=True)
 
-        try:
-            convert_file(src_path, dst_path, metadata, args.assets_folder, assets_tracking, snippet_destination_folder, missing_snippets, args.dest, file_metadata)
-            converted_count += 1
+    with ProcessPoolExecutor(initializer=init_convert_worker, initargs=(worker_context,)) as executor:
+        futures = {}
+        for filepath, metadata in file_metadata.items():
+            src_path = os.path.join(args.source, filepath)
+            futures[filepath] = executor.submit(convert_file_in_worker, src_path, dst_paths[filepath], metadata)
 
-            # Track whether this was matched or unmatched
-            if filepath in unmatched_files:
-                converted_unmatched += 1
-            else:
-                converted_matched += 1
-        except Exception as e:
-            print(f"Error converting {filepath}: {e}", file=sys.stderr)
-            error_count += 1
+        # Collect results in nav order so the reports stay deterministic
+        for filepath, future in futures.items():
+            try:
+                file_assets, file_missing_snippets, file_warning_messages = future.result()
+                converted_count += 1
+
+                for asset_filename, md_filenames in file_assets.items():
+                    assets_tracking[asset_filename].extend(md_filenames)
+                missing_snippets.extend(file_missing_snippets)
+                warning_messages.extend(file_warning_messages)
+
+                # Track whether this was matched or unmatched
+                if filepath in unmatched_files:
+                    converted_unmatched += 1
+                else:
+                    converted_matched += 1
+            except Exception as e:
+                warning_messages.append(f"Error converting {filepath}: {e}")
+                error_count += 1
+
+    if warning_messages:
+        sys.stderr.write('\n'.join(warning_messages) + '\n')
 
     write_bundle_files(section_metadata, args.dest)
 
@@ -933,25 +1200,32 @@ def main():
         print("\n" + "-"*70)
         print("ASSETS REPORT")
         print("-"*70)
+        # Report lines are emitted with a single write rather than one print per line
+        lines = []
         for asset_filename in sorted(assets_tracking.keys()):
-            for md_filename in sorted(assets_tracking[asset_filename]):
-                print(f"{asset_filename}\t{md_filename}")
+            for md_filename in sorted(set(assets_tracking[asset_filename])):
+                lines.append(f"{asset_filename}\t{md_filename}\n")
+        sys.stdout.write(''.join(lines))
 
     if unmatched_files:
         print("\n" + "-"*70)
         print("FILES NOT IN mkdocs.yml nav (migrated with higher weights)")
         print("-"*70)
+        lines = []
         for unmatched in sorted(unmatched_files):
             # Get the weight assigned to this file
             weight = file_metadata[unmatched]['weight']
-            print(f"  {unmatched} (weight: {weight})")
+            lines.append(f"  {unmatched} (weight: {weight})\n")
+        sys.stdout.write(''.join(lines))
 
     if missing_snippets:
         print("\n" + "-"*70)
         print("MISSING SNIPPETS")
         print("-"*70)
-        for missing in missing_snippets:
-            print(f"  Snippet '{missing['snippet']}' referenced in '{missing['referenced_in']}' not found in {snippet_destination_folder}")
+        sys.stdout.write(''.join(
+            f"  Snippet '{missing['snippet']}' referenced in '{missing['referenced_in']}' not found in {snippet_destination_folder}\n"
+            for missing in missing_snippets
+        ))
 
     print("\nConversion complete!")
 
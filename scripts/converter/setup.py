@@ -0,0 +1,27 @@
+"""Optional compiled build of the mkdocs to Hugo converter.
+
+The converter is a plain script and runs as-is. For large conversions it
+can be compiled with Cython, which removes interpreter overhead from the
+regex/string rewriting hot path:
+
+    python3 setup.py build_ext --inplace
+
+Python then imports the compiled extension in preference to the .py file.
+Since `python3 convert_mkdocs_to_hugo.py` always runs the source file, run
+the compiled module with:
+
+    python3 -c 'from convert_mkdocs_to_hugo import main; main()' --config ...
+
+Delete the generated .so/.c files to go back to the pure-Python module.
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name='convert-mkdocs-to-hugo',
+    ext_modules=cythonize(
+        ['convert_mkdocs_to_hugo.py'],
+        compiler_directives={'language_level': '3'},
+    ),
+)
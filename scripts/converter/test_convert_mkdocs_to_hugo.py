@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Tests for convert_mkdocs_to_hugo.py conversion functions."""
 
+import json
 import os
 import tempfile
 import shutil
@@ -16,9 +17,19 @@ from convert_mkdocs_to_hugo import (
     generate_front_matter,
     replace_yaml_includes,
     find_asset_in_folder,
+    find_asset_in_index,
+    build_asset_index,
+    rewrite_asset_paths,
     copy_snippets_folder,
+    parse_mkdocs_nav,
+    load_nav_metadata,
+    convert_file,
+    NAV_CACHE_VERSION,
 )
 
+# Filesystem fixtures go on RAM-backed tmpfs when the platform has one
+TEMP_ROOT = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
 
 class TestStripFrontMatter(unittest.TestCase):
     """Test stripping of YAML and TOML front matter."""
@@ -412,6 +423,113 @@ Some text here.
         self.assertEqual(result, expected)
 
 
+class TestParseMkdocsNav(unittest.TestCase):
+    """Test parsing of the mkdocs.yml nav section."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.source_files = {'index.md', 'guides/intro.md', 'guides/templating.md', 'guides/quoted-page.md'}
+
+        self.config = os.path.join(self.temp_dir, 'mkdocs.yml')
+        with open(self.config, 'w') as f:
+            f.write('''site_name: Test
+markdown_extensions:
+  - pymdownx.emoji:
+      emoji_index: !!python/name:material.extensions.emoji.twemoji
+nav:
+  - Overview: index.md
+  - Guides:
+    - "Getting Started": guides/intro.md
+    - Advanced Topics:
+      - Templating: guides/templating.md
+    - "guides/quoted-page.md"
+    - Missing: guides/missing.md
+  - External: https://example.com
+theme:
+  name: material
+''')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_files_and_sections(self):
+        file_metadata, section_metadata = parse_mkdocs_nav(self.config, self.source_files)
+
+        self.assertEqual(file_metadata['index.md']['output_path'], 'index.md')
+        self.assertEqual(file_metadata['index.md']['weight'], 10)
+        self.assertEqual(file_metadata['guides/intro.md']['title'], 'Getting Started')
+        self.assertEqual(file_metadata['guides/intro.md']['output_path'], 'guides/intro.md')
+        self.assertEqual(file_metadata['guides/templating.md']['output_path'], 'guides/advanced-topics/templating.md')
+        self.assertEqual(file_metadata['guides/templating.md']['hierarchy_titles'], ['Guides', 'Advanced Topics'])
+        self.assertEqual(section_metadata, {
+            'guides': {'title': 'Guides', 'weight': 20},
+            'guides/advanced-topics': {'title': 'Advanced Topics', 'weight': 40},
+        })
+
+    def test_title_derived_from_filename(self):
+        file_metadata, _ = parse_mkdocs_nav(self.config, self.source_files)
+        self.assertEqual(file_metadata['guides/quoted-page.md']['title'], 'Quoted Page')
+        self.assertEqual(file_metadata['guides/quoted-page.md']['weight'], 60)
+
+    def test_missing_and_external_entries_are_skipped(self):
+        file_metadata, _ = parse_mkdocs_nav(self.config, self.source_files)
+        self.assertNotIn('guides/missing.md', file_metadata)
+        self.assertNotIn('https://example.com', file_metadata)
+        self.assertEqual(len(file_metadata), 4)
+
+    def test_unquoted_titles_kept_as_written(self):
+        # YAML 1.1 would read these keys as booleans and numbers
+        with open(self.config, 'w') as f:
+            f.write('''nav:
+  - On: index.md
+  - 1.10: guides/intro.md
+  - No:
+    - Templating: guides/templating.md
+''')
+        file_metadata, section_metadata = parse_mkdocs_nav(self.config, self.source_files)
+
+        self.assertEqual(file_metadata['index.md']['title'], 'On')
+        self.assertEqual(file_metadata['guides/intro.md']['title'], '1.10')
+        self.assertEqual(section_metadata, {'no': {'title': 'No', 'weight': 30}})
+        self.assertEqual(file_metadata['guides/templating.md']['output_path'], 'no/templating.md')
+
+    def test_missing_nav_raises(self):
+        with open(self.config, 'w') as f:
+            f.write('site_name: Test\n')
+        with self.assertRaises(ValueError):
+            parse_mkdocs_nav(self.config, self.source_files)
+
+    def test_nav_cache_reused_until_sources_change(self):
+        cache_path = os.path.join(self.temp_dir, '.nav_cache.json')
+        expected = parse_mkdocs_nav(self.config, self.source_files)
+
+        self.assertEqual(load_nav_metadata(self.config, self.temp_dir, self.source_files, cache_path), expected)
+        self.assertTrue(os.path.exists(cache_path))
+
+        # Tamper with the cached result to show an unchanged key skips the reparse
+        with open(cache_path) as f:
+            cached = json.load(f)
+        cached['file_metadata']['index.md']['title'] = 'From Cache'
+        with open(cache_path, 'w') as f:
+            json.dump(cached, f)
+        file_metadata, _ = load_nav_metadata(self.config, self.temp_dir, self.source_files, cache_path)
+        self.assertEqual(file_metadata['index.md']['title'], 'From Cache')
+
+        # A cache written by another version of the parser is not reused
+        cached['key']['version'] -= 1
+        with open(cache_path, 'w') as f:
+            json.dump(cached, f)
+        file_metadata, _ = load_nav_metadata(self.config, self.temp_dir, self.source_files, cache_path)
+        self.assertEqual(file_metadata['index.md']['title'], 'Overview')
+
+        # Restore the tampered current-version cache: a different set of source files invalidates it
+        cached['key']['version'] = NAV_CACHE_VERSION
+        with open(cache_path, 'w') as f:
+            json.dump(cached, f)
+        file_metadata, _ = load_nav_metadata(self.config, self.temp_dir, self.source_files | {'new.md'}, cache_path)
+        self.assertEqual(file_metadata['index.md']['title'], 'Overview')
+
+
 class TestGenerateFrontMatter(unittest.TestCase):
     """Test TOML front matter generation."""
 
@@ -438,20 +556,21 @@ class TestGenerateFrontMatter(unittest.TestCase):
 class TestReplaceYamlIncludes(unittest.TestCase):
     """Test replacement of include blocks with Hugo readfile shortcodes."""
 
-    def setUp(self):
-        # Create temporary snippet folder for testing
-        self.temp_dir = tempfile.mkdtemp()
-        self.snippet_folder = os.path.join(self.temp_dir, 'snippets')
-        os.makedirs(self.snippet_folder)
+    @classmethod
+    def setUpClass(cls):
+        # Create temporary snippet folder shared by the tests
+        cls.temp_dir = tempfile.mkdtemp(dir=TEMP_ROOT)
+        cls.snippet_folder = os.path.join(cls.temp_dir, 'snippets')
+        os.makedirs(cls.snippet_folder)
 
-        # Create some test snippet files
-        with open(os.path.join(self.snippet_folder, 'test.yaml'), 'w') as f:
-            f.write('test: content')
-        with open(os.path.join(self.snippet_folder, 'example.yaml'), 'w') as f:
-            f.write('example: data')
+        # Create some test snippet files, each written with a single unbuffered write
+        for name, payload in (('test.yaml', b'test: content'), ('example.yaml', b'example: data')):
+            with open(os.path.join(cls.snippet_folder, name), 'wb', buffering=0) as f:
+                f.write(payload)
 
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir)
 
     def test_jinja_include_with_yaml_block_single_quotes(self):
         content = '''```yaml
@@ -591,20 +710,21 @@ More text
 class TestFindAssetInFolder(unittest.TestCase):
     """Test finding assets in the assets folder."""
 
-    def setUp(self):
-        # Create temporary assets folder structure
-        self.temp_dir = tempfile.mkdtemp()
-        self.assets_folder = os.path.join(self.temp_dir, 'assets')
-        os.makedirs(os.path.join(self.assets_folder, 'images'))
-        os.makedirs(os.path.join(self.assets_folder, 'pictures'))
+    @classmethod
+    def setUpClass(cls):
+        # Create temporary assets folder structure shared by the tests (which only read it)
+        cls.temp_dir = tempfile.mkdtemp(dir=TEMP_ROOT)
+        cls.assets_folder = os.path.join(cls.temp_dir, 'assets')
 
-        # Create test files
-        Path(os.path.join(self.assets_folder, 'logo.png')).touch()
-        Path(os.path.join(self.assets_folder, 'images', 'hero.jpg')).touch()
-        Path(os.path.join(self.assets_folder, 'pictures', 'test image.png')).touch()
+        # Create (empty) test files along with their directories
+        for rel_path in ('logo.png', 'images/hero.jpg', 'pictures/test image.png'):
+            asset_file = Path(cls.assets_folder) / rel_path
+            asset_file.parent.mkdir(parents=True, exist_ok=True)
+            asset_file.write_bytes(b'')
 
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir)
 
     def test_find_asset_in_root(self):
         result = find_asset_in_folder('logo.png', self.assets_folder)
@@ -628,20 +748,82 @@ class TestFindAssetInFolder(unittest.TestCase):
         result = find_asset_in_folder('nonexistent.png', self.assets_folder)
         self.assertIsNone(result)
 
+    def test_find_asset_case_insensitive_fallback(self):
+        result = find_asset_in_folder('Hero.JPG', self.assets_folder)
+        self.assertEqual(result, '/images/hero.jpg')
+
+    def test_build_asset_index(self):
+        asset_index = build_asset_index(self.assets_folder)
+        self.assertEqual(asset_index, {
+            'logo.png': '/logo.png',
+            'hero.jpg': '/images/hero.jpg',
+            'test image.png': '/pictures/test%20image.png',
+            'test%20image.png': '/pictures/test%20image.png',
+        })
+        self.assertEqual(find_asset_in_index('test%20image.png', asset_index), '/pictures/test%20image.png')
+        self.assertIsNone(find_asset_in_index('nonexistent.png', asset_index))
+
+
+class TestRewriteAssetPaths(unittest.TestCase):
+    """Test rewriting of asset references in markdown content."""
+
+    def setUp(self):
+        self.asset_index = {
+            'logo.png': '/logo.png',
+            'test image.png': '/pictures/test%20image.png',
+        }
+
+    def test_rewrite_markdown_and_html_images(self):
+        content = '''![Logo](../pictures/logo.png)
+<img src="../pictures/test%20image.png" width="50%">
+<img src='logo.png'>
+'''
+        expected = '''![Logo](/logo.png)
+<img src="/pictures/test%20image.png" width="50%">
+<img src='/logo.png'>
+'''
+        assets_tracking = defaultdict(list)
+        warning_messages = []
+        result = rewrite_asset_paths(content, self.asset_index, assets_tracking, 'page.md', warning_messages)
+        self.assertEqual(result, expected)
+        self.assertEqual(warning_messages, [])
+        self.assertEqual(sorted(assets_tracking), ['logo.png', 'test image.png'])
+        self.assertEqual(assets_tracking['logo.png'], ['page.md', 'page.md'])
+
+    def test_external_and_missing_assets_are_kept(self):
+        content = (
+            '![ext](https://example.com/logo.png) ![missing](missing.png)\n'
+            '<img src="//cdn.example.com/logo.png"> ![inline](data:image/png;base64,logo.png)\n'
+        )
+        assets_tracking = defaultdict(list)
+        warning_messages = []
+        result = rewrite_asset_paths(content, self.asset_index, assets_tracking, 'page.md', warning_messages)
+        self.assertEqual(result, content)
+        self.assertEqual(len(assets_tracking), 0)
+        self.assertEqual(warning_messages, [
+            "Warning: Asset 'missing.png' referenced in 'page.md' not found in assets folder",
+        ])
+
 
 class TestCopySnippetsFolder(unittest.TestCase):
     """Test copying snippets folder."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp(dir=TEMP_ROOT)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir)
+
     def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self.source_dir = os.path.join(self.temp_dir, 'source')
-        self.dest_dir = os.path.join(self.temp_dir, 'dest')
+        # Every test writes its own tree, so give each one a fresh directory
+        test_dir = tempfile.mkdtemp(dir=self.temp_dir)
+        self.source_dir = os.path.join(test_dir, 'source')
+        self.dest_dir = os.path.join(test_dir, 'dest')
         os.makedirs(self.source_dir)
         os.makedirs(self.dest_dir)
 
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
-
     def test_copy_snippets_folder_exists(self):
         # Create snippets folder with content
         snippets_dir = os.path.join(self.source_dir, 'snippets')
@@ -709,6 +891,42 @@ class TestCopySnippetsFolder(unittest.TestCase):
             content = f.read()
         self.assertEqual(content, 'apiVersion: kustomize.config.k8s.io/v1beta1')
 
+    def test_copy_snippets_skips_unchanged_files(self):
+        snippets_dir = os.path.join(self.source_dir, 'snippets')
+        os.makedirs(snippets_dir)
+        src_file = os.path.join(snippets_dir, 'test.yaml')
+        with open(src_file, 'w') as f:
+            f.write('test: content')
+
+        snippet_dest = os.path.join(self.dest_dir, 'snippets')
+        copy_snippets_folder(self.source_dir, snippet_dest)
+        dst_file = os.path.join(snippet_dest, 'test.yaml')
+
+        # The copy carries the source mtime, so an unchanged source is skipped
+        self.assertEqual(os.stat(dst_file).st_mtime_ns, os.stat(src_file).st_mtime_ns)
+        with open(dst_file, 'w') as f:
+            f.write('untouched')
+        os.utime(dst_file, ns=(os.stat(src_file).st_atime_ns, os.stat(src_file).st_mtime_ns))
+        copy_snippets_folder(self.source_dir, snippet_dest)
+        with open(dst_file, 'r') as f:
+            self.assertEqual(f.read(), 'untouched')
+
+        # Source replaced by content with an older mtime (e.g. an extracted archive): copied again
+        with open(src_file, 'w') as f:
+            f.write('test: older release')
+        os.utime(src_file, (1000, 1000))
+        copy_snippets_folder(self.source_dir, snippet_dest)
+        with open(dst_file, 'r') as f:
+            self.assertEqual(f.read(), 'test: older release')
+
+        # Source with a newer mtime than the copy: copied again
+        with open(src_file, 'w') as f:
+            f.write('test: content')
+        os.utime(src_file, (2000, 2000))
+        copy_snippets_folder(self.source_dir, snippet_dest)
+        with open(dst_file, 'r') as f:
+            self.assertEqual(f.read(), 'test: content')
+
     def test_copy_snippets_folder_not_exists(self):
         # No snippets folder in source
         snippet_dest = os.path.join(self.dest_dir, 'snippets')
@@ -751,6 +969,35 @@ spec:
         self.assertIn('{{ .remoteRef.key }}', cleaned_content)  # Template should remain
 
 
+class TestConvertFile(unittest.TestCase):
+    """Test converting a single markdown file."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(dir=TEMP_ROOT)
+        self.dest_dir = os.path.join(self.temp_dir, 'dest')
+        self.snippet_folder = os.path.join(self.dest_dir, 'snippets')
+        os.makedirs(self.snippet_folder)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_crlf_source_written_with_lf(self):
+        src_path = os.path.join(self.temp_dir, 'page.md')
+        with open(src_path, 'wb') as f:
+            f.write(b'---\r\ntitle: Old\r\n---\r\n# Intro\r\n\r\n!!! note\r\n    body\r\n\r\nText\r\n')
+
+        dst_path = os.path.join(self.dest_dir, 'page.md')
+        metadata = {'title': 'Page', 'weight': 10, 'output_path': 'page.md'}
+        convert_file(src_path, dst_path, metadata, {}, self.snippet_folder, set(), self.dest_dir, {'page.md': metadata})
+
+        with open(dst_path, 'rb') as f:
+            output = f.read()
+        self.assertNotIn(b'\r', output)
+        self.assertNotIn(b'title: Old', output)
+        self.assertIn(b'# Intro\n', output)
+        self.assertIn(b'Text\n', output)
+
+
 class TestIntegrationScenarios(unittest.TestCase):
     """Integration tests for complete conversion scenarios."""
 